@@ -12,6 +12,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import collections
+import contextlib
+import queue
+
 from llvmlite import binding as ll
 from llvmlite.llvmpy import core as lc
 
@@ -41,19 +45,8 @@ class SPIRVCodeLibrary(CodeLibrary):
 
     def _optimize_final_module(self):
         # Run some lightweight optimization to simplify the module.
-        pmb = ll.PassManagerBuilder()
-
-        # Make optimization level depending on config.OPT variable
-        pmb.opt_level = config.OPT
-
-        pmb.disable_unit_at_a_time = False
-        pmb.disable_unroll_loops = True
-        pmb.loop_vectorize = False
-        pmb.slp_vectorize = False
-
-        pm = ll.ModulePassManager()
-        pmb.populate(pm)
-        pm.run(self._final_module)
+        with self._codegen._pooled_module_pass_manager() as pm:
+            pm.run(self._final_module)
 
     def _finalize_specific(self):
         # Fix global naming
@@ -78,6 +71,7 @@ class JITSPIRVCodegen(BaseCPUCodegen):
         assert list(llvm_module.global_variables) == [], "Module isn't empty"
         self._data_layout = SPIR_DATA_LAYOUT[utils.MACHINE_BITS]
         self._target_data = ll.create_target_data(self._data_layout)
+        self._mpm_pools = collections.defaultdict(queue.SimpleQueue)
 
     def _create_empty_module(self, name):
         ir_module = lc.Module(name)
@@ -89,6 +83,37 @@ class JITSPIRVCodegen(BaseCPUCodegen):
     def _module_pass_manager(self):
         raise NotImplementedError
 
+    @contextlib.contextmanager
+    def _pooled_module_pass_manager(self):
+        # Constructing and populating a pass manager is costly compared to
+        # running it on a small kernel module, so populated pass managers are
+        # pooled per optimization level and handed to one library at a time.
+        opt_level = config.OPT
+        pool = self._mpm_pools[opt_level]
+        try:
+            pm = pool.get_nowait()
+        except queue.Empty:
+            pm = self._create_module_pass_manager(opt_level)
+        try:
+            yield pm
+        finally:
+            pool.put(pm)
+
+    def _create_module_pass_manager(self, opt_level):
+        pmb = ll.PassManagerBuilder()
+
+        # Make optimization level depending on config.OPT variable
+        pmb.opt_level = opt_level
+
+        pmb.disable_unit_at_a_time = False
+        pmb.disable_unroll_loops = True
+        pmb.loop_vectorize = False
+        pmb.slp_vectorize = False
+
+        pm = ll.ModulePassManager()
+        pmb.populate(pm)
+        return pm
+
     def _function_pass_manager(self, llvm_module):
         raise NotImplementedError
 
@@ -582,27 +582,36 @@ class DPPYKernel(DPPYKernelBase):
                 usm_mem = as_usm_obj(val, queue=sycl_queue, copy=False)
 
                 orig_val = val
-                packed = False
-                if not val.flags.c_contiguous:
+                if val.flags.f_contiguous and not val.flags.c_contiguous:
+                    # F-contiguous arrays are typed with layout "F" and are
+                    # passed as they are. Their transposed view is
+                    # C-contiguous over the same memory and is used to copy
+                    # the data to and from the USM memory.
+                    host_val = val.T
+                else:
                     # If the numpy.ndarray is not C-contiguous
                     # we pack the strided array into a packed array.
-                    # This allows us to treat the data from here on as C-contiguous.
-                    # While packing we treat the data as C-contiguous.
+                    # This allows us to treat the data from here on as
+                    # C-contiguous. numpy.ascontiguousarray() returns the
+                    # array itself when it is already C-contiguous and
+                    # otherwise makes a single packed copy that keeps the
+                    # original shape.
                     # We store the reference of both (strided and packed)
                     # array and during unpacking we use numpy.copyto() to copy
                     # the data back from the packed temporary array to the
                     # original strided array.
-                    packed_val = val.flatten(order="C")
-                    packed = True
+                    packed_val = np.ascontiguousarray(val)
+                    host_val = packed_val
+                packed = packed_val is not val
 
                 if (
                     default_behavior
                     or self.valid_access_types[access_type] == _NUMBA_DPPY_READ_ONLY
                     or self.valid_access_types[access_type] == _NUMBA_DPPY_READ_WRITE
                 ):
-                    copy_from_numpy_to_usm_obj(usm_mem, packed_val)
+                    copy_from_numpy_to_usm_obj(usm_mem, host_val)
 
-                device_arrs[-1] = (usm_mem, orig_val, packed_val, packed)
+                device_arrs[-1] = (usm_mem, orig_val, host_val, packed)
 
             self._unpack_device_array_argument(
                 packed_val.size,
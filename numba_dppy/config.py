@@ -105,3 +105,10 @@ LLVM_SPIRV_ROOT = _readenv("NUMBA_DPPY_LLVM_SPIRV_ROOT", str, "")
 # Emit debug info
 DEBUG = _readenv("NUMBA_DPPY_DEBUG", int, config.DEBUG)
 DEBUGINFO_DEFAULT = _readenv("NUMBA_DPPY_DEBUGINFO", int, config.DEBUGINFO_DEFAULT)
+
+# Cache functions compiled by the DPPY offload pipeline on disk. Functions
+# that launch SYCL kernels refer to process-local kernel objects and are
+# never written to the cache.
+CACHE = _readenv("NUMBA_DPPY_CACHE", int, 0)
+# Directory for the DPPY on-disk cache, defaults to Numba's cache locations.
+CACHE_DIR = _readenv("NUMBA_DPPY_CACHE_DIR", str, "")
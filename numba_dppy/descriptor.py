@@ -13,9 +13,8 @@
 # limitations under the License.
 
 from numba.core.descriptors import TargetDescriptor
-from numba.core.options import TargetOptions
 
-from numba.core import dispatcher, utils, typing
+from numba.core import utils
 from .target import DPPYTargetContext, DPPYTypingContext
 
 from numba.core.cpu import CPUTargetOptions
@@ -12,6 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import functools
+
 from numba.core.types.npytypes import Array
 from numba.core import types
 from numba.core.datamodel.models import StructModel
@@ -46,24 +48,30 @@ class DPPYArray(Array):
         )
 
     def copy(self, dtype=None, ndim=None, layout=None, readonly=None, addrspace=None):
-        if dtype is None:
-            dtype = self.dtype
-        if ndim is None:
-            ndim = self.ndim
-        if layout is None:
-            layout = self.layout
-        if readonly is None:
-            readonly = not self.mutable
-        if addrspace is None:
-            addrspace = self.addrspace
-        return DPPYArray(
-            dtype=dtype,
-            ndim=ndim,
-            layout=layout,
-            readonly=readonly,
-            aligned=self.aligned,
-            addrspace=addrspace,
-        )
+        changes = {
+            name: value
+            for name, value in (
+                ("dtype", dtype),
+                ("ndim", ndim),
+                ("layout", layout),
+                ("readonly", readonly),
+                ("addrspace", addrspace),
+            )
+            if value is not None
+        }
+        if not changes and type(self) is DPPYArray:
+            # Numba interns types by key, so an unchanged copy is self.
+            return self
+        args = {
+            "dtype": self.dtype,
+            "ndim": self.ndim,
+            "layout": self.layout,
+            "readonly": not self.mutable,
+            "aligned": self.aligned,
+            "addrspace": self.addrspace,
+        }
+        args.update(changes)
+        return DPPYArray(**args)
 
     @property
     def key(self):
@@ -82,14 +90,20 @@ class DPPYArray(Array):
 
 class DPPYArrayModel(StructModel):
     def __init__(self, dmm, fe_type):
-        ndim = fe_type.ndim
-        members = [
-            ("meminfo", types.CPointer(fe_type.dtype, addrspace=fe_type.addrspace)),
-            ("parent", types.CPointer(fe_type.dtype, addrspace=fe_type.addrspace)),
+        members = self._make_members(fe_type.dtype, fe_type.ndim, fe_type.addrspace)
+        super(DPPYArrayModel, self).__init__(dmm, fe_type, members)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def _make_members(dtype, ndim, addrspace):
+        # Numba types are immutable and interned, so the member list only
+        # depends on (dtype, ndim, addrspace) and can be shared.
+        return (
+            ("meminfo", types.CPointer(dtype, addrspace=addrspace)),
+            ("parent", types.CPointer(dtype, addrspace=addrspace)),
             ("nitems", types.intp),
             ("itemsize", types.intp),
-            ("data", types.CPointer(fe_type.dtype, addrspace=fe_type.addrspace)),
+            ("data", types.CPointer(dtype, addrspace=addrspace)),
             ("shape", types.UniTuple(types.intp, ndim)),
             ("strides", types.UniTuple(types.intp, ndim)),
-        ]
-        super(DPPYArrayModel, self).__init__(dmm, fe_type, members)
+        )
@@ -0,0 +1,75 @@
+# Copyright 2021 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""On-disk caching support for functions compiled with the DPPY pipeline."""
+
+import os
+
+import dpctl
+from numba.core.caching import (
+    CompileResultCacheImpl,
+    FunctionCache,
+    _UserProvidedCacheLocator,
+)
+
+from numba_dppy import config
+
+
+class _DppyUserProvidedCacheLocator(_UserProvidedCacheLocator):
+    """
+    A locator that stores the cache under ``NUMBA_DPPY_CACHE_DIR``.
+
+    Keeping DPPY compiled functions out of the default Numba cache directory
+    avoids mixing them with caches written by the regular CPU pipeline.
+    """
+
+    def __init__(self, py_func, py_file):
+        self._py_file = py_file
+        self._lineno = py_func.__code__.co_firstlineno
+        appdir = os.path.abspath(config.CACHE_DIR)
+        cache_subpath = self.get_suitable_cache_subpath(py_file)
+        self._cache_path = os.path.join(appdir, cache_subpath)
+
+    @classmethod
+    def from_function(cls, py_func, py_file):
+        if not config.CACHE_DIR:
+            return
+        parent = super(_UserProvidedCacheLocator, cls)
+        return parent.from_function(py_func, py_file)
+
+
+class DppyCacheImpl(CompileResultCacheImpl):
+    _locator_classes = [
+        _DppyUserProvidedCacheLocator
+    ] + CompileResultCacheImpl._locator_classes
+
+
+class DppyFunctionCache(FunctionCache):
+    """
+    Implements caching for functions compiled by
+    :class:`numba_dppy.dppy_offload_dispatcher.DppyOffloadDispatcher`.
+    """
+
+    _impl_class = DppyCacheImpl
+
+    def _index_key(self, sig, codegen):
+        # Code compiled for one SYCL device or driver must not be loaded for
+        # another, so both are part of the key. This lets processes share one
+        # cache directory across different devices. Note that it also keeps
+        # a separate entry per device for code that does not depend on the
+        # device, such as functions that launch no kernel, which today are
+        # the only functions that get cached.
+        device = dpctl.get_current_queue().get_sycl_device()
+        key = super()._index_key(sig, codegen)
+        return key + ((device.filter_string, device.driver_version),)
@@ -15,6 +15,7 @@
 from numba.core import dispatcher, compiler
 from numba.core.registry import cpu_target, dispatcher_registry
 from numba_dppy import config
+from numba_dppy.dppy_caching import DppyFunctionCache
 
 
 class DppyOffloadDispatcher(dispatcher.Dispatcher):
@@ -59,6 +60,12 @@ class DppyOffloadDispatcher(dispatcher.Dispatcher):
                 pipeline_class=pipeline_class,
             )
 
+        if config.CACHE:
+            self.enable_caching()
+
+    def enable_caching(self):
+        self._cache = DppyFunctionCache(self.py_func)
+
 
 dispatcher_registry["__dppy_offload_gpu__"] = DppyOffloadDispatcher
 dispatcher_registry["__dppy_offload_cpu__"] = DppyOffloadDispatcher
@@ -416,9 +416,10 @@ class KernelLaunchOps:
             )
 
         args = [
-            self.builder.inttoptr(
-                self.context.get_constant(types.uintp, self.kernel_addr),
-                utils.get_llvm_type(context=self.context, type=types.voidptr),
+            # The kernel address is only valid in this process. Emitting it
+            # as a dynamic address keeps Numba from caching the function.
+            self.context.add_dynamic_addr(
+                self.builder, self.kernel_addr, info="SYCL kernel"
             ),
             self.builder.load(sycl_queue_val),
             self.kernel_arg_array,
@@ -19,7 +19,12 @@ import dpctl
 import dpctl.tensor as dpt
 import dpctl.memory as dpctl_mem
 from . import _helper
-from numba_dppy.utils import has_usm_memory, as_usm_obj, copy_to_numpy_from_usm_obj
+from numba_dppy.utils import (
+    has_usm_memory,
+    as_usm_obj,
+    copy_from_numpy_to_usm_obj,
+    copy_to_numpy_from_usm_obj,
+)
 
 
 def test_has_usm_memory(offload_device):
@@ -55,3 +60,61 @@ def test_as_usm_obj(offload_device):
         usm_mem = as_usm_obj(b, queue=queue, copy=False)
         copy_to_numpy_from_usm_obj(usm_mem, b_copy)
         assert np.any(np.not_equal(b, b_copy))
+
+        # Non-contiguous input can only be allocated for, not copied from.
+        c = np.ones((32, 32), dtype=np.float32)[:, ::2]
+        with pytest.raises(ValueError):
+            as_usm_obj(c, queue=queue)
+        usm_mem = as_usm_obj(c, queue=queue, copy=False)
+        assert usm_mem.size == c.nbytes
+
+
+@pytest.mark.parametrize(
+    "usm_type, usm_class",
+    [
+        ("shared", dpctl_mem.MemoryUSMShared),
+        ("device", dpctl_mem.MemoryUSMDevice),
+        ("host", dpctl_mem.MemoryUSMHost),
+    ],
+)
+def test_as_usm_obj_usm_type(offload_device, usm_type, usm_class):
+    a = np.arange(1023, dtype=np.float32)
+
+    with dpctl.device_context(offload_device) as queue:
+        usm_mem = as_usm_obj(a, queue=queue, usm_type=usm_type)
+        assert isinstance(usm_mem, usm_class)
+        assert usm_mem.size == a.nbytes
+
+        a_copy = np.empty_like(a)
+        copy_to_numpy_from_usm_obj(usm_mem, a_copy)
+        assert np.array_equal(a, a_copy)
+
+
+def test_as_usm_obj_invalid_usm_type(offload_device):
+    a = np.ones(1023, dtype=np.float32)
+
+    with dpctl.device_context(offload_device) as queue:
+        with pytest.raises(ValueError):
+            as_usm_obj(a, queue=queue, usm_type="invalid")
+
+
+def test_copy_usm_obj_multi_dim(offload_device):
+    a = np.arange(6 * 5 * 4, dtype=np.float64).reshape(6, 5, 4)
+
+    with dpctl.device_context(offload_device) as queue:
+        usm_mem = as_usm_obj(a, queue=queue, copy=False)
+        copy_from_numpy_to_usm_obj(usm_mem, a)
+
+        a_copy = np.empty_like(a)
+        copy_to_numpy_from_usm_obj(usm_mem, a_copy)
+        assert np.array_equal(a, a_copy)
+
+
+def test_copy_to_non_contiguous_numpy(offload_device):
+    a = np.ones((8, 8), dtype=np.float32)
+
+    with dpctl.device_context(offload_device) as queue:
+        usm_mem = as_usm_obj(a[:, :4], queue=queue, copy=False)
+
+        with pytest.raises(ValueError):
+            copy_to_numpy_from_usm_obj(usm_mem, a[:, ::2])
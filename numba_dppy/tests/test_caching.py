@@ -0,0 +1,137 @@
+# Copyright 2021 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import warnings
+
+import numpy as np
+import pytest
+import dpctl
+from numba import njit, prange, types
+from numba.core.caching import NullCache
+from numba.core.errors import NumbaWarning
+from numba.core.registry import cpu_target
+
+from numba_dppy.dppy_caching import DppyFunctionCache
+from numba_dppy.tests._helper import override_config, skip_test
+from numba_dppy.tests.conftest import offload_devices
+
+
+def add(a, b):
+    return a + b
+
+
+def prange_inc(a):
+    for i in prange(a.shape[0]):
+        a[i] = a[i] + 1
+
+
+def _cache_files(cache_dir):
+    return [
+        name
+        for _, _, files in os.walk(cache_dir)
+        for name in files
+        if name.endswith((".nbi", ".nbc"))
+    ]
+
+
+def test_cache_function_without_kernel(offload_device, tmp_path):
+    if skip_test(offload_device):
+        pytest.skip()
+
+    with override_config("CACHE", 1), override_config("CACHE_DIR", str(tmp_path)):
+        with dpctl.device_context(offload_device):
+            jitted = njit(add)
+            assert jitted(1.0, 2.0) == 3.0
+            disp = jitted.get_compiled()
+            assert isinstance(disp._cache, DppyFunctionCache)
+            assert disp.stats.cache_path.startswith(str(tmp_path))
+            assert sum(disp.stats.cache_hits.values()) == 0
+
+            files = _cache_files(tmp_path)
+            assert any(name.endswith(".nbi") for name in files)
+            assert any(name.endswith(".nbc") for name in files)
+
+            # A new dispatcher for the same function loads it from disk.
+            jitted = njit(add)
+            assert jitted(1.0, 2.0) == 3.0
+            disp = jitted.get_compiled()
+            assert sum(disp.stats.cache_hits.values()) == 1
+
+
+def test_cache_skips_offloaded_function(offload_device, tmp_path):
+    if skip_test(offload_device):
+        pytest.skip()
+
+    a = np.zeros(10, dtype=np.float64)
+    with override_config("CACHE", 1), override_config("CACHE_DIR", str(tmp_path)):
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter("always", NumbaWarning)
+            with dpctl.device_context(offload_device):
+                njit(prange_inc)(a)
+
+    np.testing.assert_array_equal(a, np.ones(10, dtype=np.float64))
+    messages = [str(x.message) for x in w if issubclass(x.category, NumbaWarning)]
+    assert any(
+        "Cannot cache compiled function" in msg and "dynamic globals" in msg
+        for msg in messages
+    )
+    # The kernel address is only valid in this process and must never be
+    # written to disk.
+    assert _cache_files(tmp_path) == []
+
+
+def test_cache_disabled(offload_device, tmp_path):
+    if skip_test(offload_device):
+        pytest.skip()
+
+    with override_config("CACHE", 0), override_config("CACHE_DIR", str(tmp_path)):
+        with dpctl.device_context(offload_device):
+            jitted = njit(add)
+            assert jitted(1.0, 2.0) == 3.0
+            assert isinstance(jitted.get_compiled()._cache, NullCache)
+
+    assert _cache_files(tmp_path) == []
+
+
+def _index_key(cache, device_type):
+    codegen = cpu_target.target_context.codegen()
+    with dpctl.device_context(device_type):
+        return cache._index_key((types.float64, types.float64), codegen)
+
+
+def test_index_key_includes_device(offload_device, tmp_path):
+    if skip_test(offload_device):
+        pytest.skip()
+
+    with override_config("CACHE_DIR", str(tmp_path)):
+        cache = DppyFunctionCache(add)
+
+    with dpctl.device_context(offload_device) as queue:
+        device = queue.get_sycl_device()
+        expected = (device.filter_string, device.driver_version)
+
+    assert _index_key(cache, offload_device)[-1] == expected
+
+
+def test_index_key_differs_between_devices(tmp_path):
+    devices = [device for device in offload_devices if not skip_test(device)]
+    if len(devices) < 2:
+        pytest.skip("Needs at least two SYCL devices")
+
+    with override_config("CACHE_DIR", str(tmp_path)):
+        cache = DppyFunctionCache(add)
+
+    keys = [_index_key(cache, device) for device in devices]
+    assert len(set(keys)) == len(keys)
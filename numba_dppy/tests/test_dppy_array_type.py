@@ -0,0 +1,49 @@
+# Copyright 2021 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from numba.core import types
+
+from numba_dppy.dppy_array_type import DPPYArray
+from numba_dppy.driver import USMNdArrayType
+from numba_dppy.utils import address_space
+
+
+def test_copy_unchanged_is_self():
+    t = DPPYArray(types.float32, 2, "C", addrspace=address_space.GLOBAL)
+    assert t.copy() is t
+
+
+def test_copy_with_override_keeps_attributes():
+    t = DPPYArray(
+        types.float32, 2, "C", aligned=False, addrspace=address_space.GLOBAL
+    )
+    c = t.copy(layout="A")
+
+    assert type(c) is DPPYArray
+    assert c.layout == "A"
+    assert c.dtype == t.dtype
+    assert c.ndim == t.ndim
+    assert c.addrspace == address_space.GLOBAL
+    assert c.aligned is False
+
+
+def test_copy_subclass_goes_through_constructor():
+    t = USMNdArrayType(types.float32, 2, "C", "shared")
+    c = t.copy()
+
+    # USMNdArrayType.copy relies on DPPYArray.copy building a new DPPYArray
+    # instead of returning the subclass instance itself.
+    assert c is not t
+    assert type(c) is DPPYArray
+    assert c.key == t.key
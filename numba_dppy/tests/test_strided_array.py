@@ -40,3 +40,34 @@ def test_strided_array_kernel(offload_device):
         sum[global_size, numba_dppy.DEFAULT_LOCAL_SIZE](a, b, got)
 
     assert np.array_equal(expected, got)
+
+
+@numba_dppy.kernel
+def sum_2d(a, b, c):
+    i = numba_dppy.get_global_id(0)
+    j = numba_dppy.get_global_id(1)
+    c[i, j] = a[i, j] + b[i, j]
+
+
+def test_strided_array_kernel_2d(offload_device):
+    if skip_test(offload_device):
+        pytest.skip()
+
+    rows, cols = 16, 12
+    # F-ordered input and a strided view with a non-unit inner stride.
+    a = np.asfortranarray(np.arange(rows * cols, dtype="i4").reshape(rows, cols))
+    b = np.arange(rows * cols * 2, dtype="i4").reshape(rows, cols * 2)[:, ::2]
+    got_base = np.zeros((rows, cols * 2), dtype="i4")
+    got = got_base[:, ::2]
+    got_f = np.zeros((rows, cols), dtype="i4", order="F")
+
+    expected = a + b
+
+    with dpctl.device_context(offload_device):
+        sum_2d[(rows, cols), numba_dppy.DEFAULT_LOCAL_SIZE](a, b, got)
+        sum_2d[(rows, cols), numba_dppy.DEFAULT_LOCAL_SIZE](b, a, got_f)
+
+    # The results are written back into the original strided arrays.
+    assert np.array_equal(expected, got)
+    assert np.array_equal(got_base[:, 1::2], np.zeros((rows, cols), dtype="i4"))
+    assert np.array_equal(expected, got_f)
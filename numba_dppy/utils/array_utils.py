@@ -24,11 +24,18 @@ supported_numpy_dtype = [
     np.int32,
     np.int64,
     np.uint32,
-    np.int64,
     np.float32,
     np.float64,
 ]
 
+_SUPPORTED_DTYPES = frozenset(np.dtype(typ) for typ in supported_numpy_dtype)
+
+_USM_CTORS = {
+    "shared": dpctl_mem.MemoryUSMShared,
+    "device": dpctl_mem.MemoryUSMDevice,
+    "host": dpctl_mem.MemoryUSMHost,
+}
+
 
 def has_usm_memory(obj):
     """
@@ -46,19 +53,27 @@ def has_usm_memory(obj):
         A Python object allocated using USM memory if argument is already
         allocated using USM (zero-copy), None otherwise.
     """
+    # Only call into dpctl for objects that expose the interface; probing a
+    # plain numpy.ndarray would raise and unwind an exception on every call.
+    if hasattr(obj, "__sycl_usm_array_interface__"):
+        usm_mem = _as_usm_memory(obj)
+        if usm_mem is not None:
+            return usm_mem
+
+    base = getattr(obj, "base", None)
+    if base is not None and hasattr(base, "__sycl_usm_array_interface__"):
+        return _as_usm_memory(base)
+
+    return None
+
+
+def _as_usm_memory(obj):
     usm_mem = None
     try:
         usm_mem = dpctl_mem.as_usm_memory(obj)
     except Exception as e:
-        if hasattr(obj, "base"):
-            try:
-                usm_mem = dpctl_mem.as_usm_memory(obj.base)
-            except Exception as e:
-                if config.DEBUG:
-                    print(e)
-        else:
-            if config.DEBUG:
-                print(e)
+        if config.DEBUG:
+            print(e)
 
     return usm_mem
 
@@ -95,7 +110,7 @@ def copy_from_numpy_to_usm_obj(usm_allocated, obj):
             "numpy.ndarray. Obj type: %s" % (type(obj))
         )
 
-    if obj.dtype not in [np.dtype(typ) for typ in supported_numpy_dtype]:
+    if obj.dtype not in _SUPPORTED_DTYPES:
         raise ValueError(
             "dtype is not supprted. Supported dtypes "
             "are: %s" % (supported_numpy_dtype)
@@ -104,17 +119,14 @@ def copy_from_numpy_to_usm_obj(usm_allocated, obj):
     if not obj.flags.c_contiguous:
         raise ValueError("Only C-contiguous numpy.ndarray is currently supported!")
 
-    size = np.prod(obj.shape)
-    if usm_mem.size != (obj.dtype.itemsize * size):
+    expected = obj.nbytes
+    if usm_mem.size != expected:
         raise ValueError(
             "Size (Bytes) of data does not match. USM allocated "
-            "memory size %d, supported object size: %d"
-            % (usm_mem.size, (obj.dtype.itemsize * size))
+            "memory size %d, supported object size: %d" % (usm_mem.size, expected)
         )
 
-    obj_memview = memoryview(obj)
-    obj_memview = obj_memview.cast("B")
-    usm_mem.copy_from_host(obj_memview)
+    usm_mem.copy_from_host(obj.reshape(-1).view(np.uint8))
 
 
 def copy_to_numpy_from_usm_obj(usm_allocated, obj):
@@ -130,7 +142,9 @@ def copy_to_numpy_from_usm_obj(usm_allocated, obj):
 
     Raises:
         TypeError: If any argument is not of permitted type.
-        ValueError: If size of data does not match.
+        ValueError:
+            1. If size of data does not match.
+            2. If obj is not C-contiguous.
     """
     usm_mem = has_usm_memory(usm_allocated)
     if usm_mem is None:
@@ -142,23 +156,24 @@ def copy_to_numpy_from_usm_obj(usm_allocated, obj):
             "numpy.ndarray. Obj type: %s" % (type(obj))
         )
 
-    if obj.dtype not in [np.dtype(typ) for typ in supported_numpy_dtype]:
+    if obj.dtype not in _SUPPORTED_DTYPES:
         raise ValueError(
             "dtype is not supprted. Supported dtypes "
             "are: %s" % (supported_numpy_dtype)
         )
 
-    size = np.prod(obj.shape)
-    if usm_mem.size != (obj.dtype.itemsize * size):
+    if not obj.flags.c_contiguous:
+        raise ValueError("Only C-contiguous numpy.ndarray is currently supported!")
+
+    expected = obj.nbytes
+    if usm_mem.size != expected:
         raise ValueError(
             "Size (Bytes) of data does not match. USM allocated "
-            "memory size %d, supported object size: %d"
-            % (usm_mem.size, (obj.dtype.itemsize * size))
+            "memory size %d, supported object size: %d" % (usm_mem.size, expected)
         )
 
-    obj_memview = memoryview(obj)
-    obj_memview = obj_memview.cast("B")
-    usm_mem.copy_to_host(obj_memview)
+    # The byte view shares its buffer with obj, so the data lands in obj.
+    usm_mem.copy_to_host(obj.reshape(-1).view(np.uint8))
 
 
 def as_usm_obj(obj, queue=None, usm_type="shared", copy=True):
@@ -192,6 +207,7 @@ def as_usm_obj(obj, queue=None, usm_type="shared", copy=True):
                is raised if queue argument is not provided.
             2. If usm_type is not valid.
             3. If dtype of the passed ndarray(obj) is not supported.
+            4. If copy is requested and obj is not C-contiguous.
     """
     usm_mem = has_usm_memory(obj)
 
@@ -205,33 +221,46 @@ def as_usm_obj(obj, queue=None, usm_type="shared", copy=True):
         )
 
     if usm_mem is None:
-        if not isinstance(obj, np.ndarray):
-            raise TypeError(
-                "Obj is not USM allocated and is not of type "
-                "numpy.ndarray. Obj type: %s" % (type(obj))
-            )
-
-        if obj.dtype not in [np.dtype(typ) for typ in supported_numpy_dtype]:
-            raise ValueError(
-                "dtype is not supprted. Supported dtypes "
-                "are: %s" % (supported_numpy_dtype)
-            )
-
-        size = np.prod(obj.shape)
-        if usm_type == "shared":
-            usm_mem = dpctl_mem.MemoryUSMShared(size * obj.dtype.itemsize, queue=queue)
-        elif usm_type == "device":
-            usm_mem = dpctl_mem.MemoryUSMDevice(size * obj.dtype.itemsize, queue=queue)
-        elif usm_type == "host":
-            usm_mem = dpctl_mem.MemoryUSMHost(size * obj.dtype.itemsize, queue=queue)
-        else:
-            raise ValueError(
-                "Supported usm_type are: 'shared', "
-                "'device' and 'host'. Provided: %s" % (usm_type)
-            )
-
-        if copy:
-            # Copy data from numpy.ndarray
-            copy_from_numpy_to_usm_obj(usm_mem, obj)
+        usm_mem = _alloc_and_fill(obj, queue, usm_type, copy)
+
+    return usm_mem
+
+
+def _alloc_and_fill(obj, queue, usm_type, copy):
+    """
+    Allocate USM memory for a numpy.ndarray and optionally copy its data.
+
+    The ndarray is validated once here, and the data is copied straight into
+    the new allocation, instead of going back through
+    copy_from_numpy_to_usm_obj, which would validate everything again.
+    """
+    if not isinstance(obj, np.ndarray):
+        raise TypeError(
+            "Obj is not USM allocated and is not of type "
+            "numpy.ndarray. Obj type: %s" % (type(obj))
+        )
+
+    if obj.dtype not in _SUPPORTED_DTYPES:
+        raise ValueError(
+            "dtype is not supprted. Supported dtypes "
+            "are: %s" % (supported_numpy_dtype)
+        )
+
+    if copy and not obj.flags.c_contiguous:
+        raise ValueError("Only C-contiguous numpy.ndarray is currently supported!")
+
+    try:
+        usm_ctor = _USM_CTORS[usm_type]
+    except KeyError:
+        raise ValueError(
+            "Supported usm_type are: 'shared', "
+            "'device' and 'host'. Provided: %s" % (usm_type)
+        )
+
+    usm_mem = usm_ctor(obj.nbytes, queue=queue)
+
+    if copy:
+        # Copy data from numpy.ndarray
+        usm_mem.copy_from_host(obj.reshape(-1).view(np.uint8))
 
     return usm_mem
@@ -18,7 +18,7 @@ import setuptools.command.install as orig_install
 import setuptools.command.develop as orig_develop
 import subprocess
 import shlex
-from setuptools import Extension, find_packages, setup
+from setuptools import Command, Extension, find_packages, setup
 from Cython.Build import cythonize
 
 import versioneer
@@ -34,6 +34,10 @@ elif sys.platform in ["win32", "cygwin"]:
     IS_WIN = True
 
 
+# Number of parallel jobs used to cythonize and compile the extensions.
+BUILD_JOBS = os.cpu_count() or 1
+
+
 def get_ext_modules():
     ext_modules = []
 
@@ -77,30 +81,59 @@ def get_ext_modules():
         ext_modules += [ext_dpnp_glue]
 
     if dpnp_present:
-        return cythonize(ext_modules)
+        return cythonize(ext_modules, nthreads=BUILD_JOBS)
     else:
         return ext_modules
 
 
 class install(orig_install.install):
     def run(self):
-        spirv_compile()
+        ensure_spirv()
         super().run()
 
 
 class develop(orig_develop.develop):
     def run(self):
-        spirv_compile()
+        ensure_spirv()
         super().run()
 
 
+class build_spir(Command):
+    description = "compile the atomic operations OpenCL source to SPIR-V"
+    user_options = []
+
+    def initialize_options(self):
+        pass
+
+    def finalize_options(self):
+        pass
+
+    def run(self):
+        spirv_compile()
+
+
 def _get_cmdclass():
     cmdclass = versioneer.get_cmdclass()
     cmdclass["install"] = install
     cmdclass["develop"] = develop
+    cmdclass["build_spir"] = build_spir
     return cmdclass
 
 
+ATOMIC_OPS_CL = "numba_dppy/ocl/atomics/atomic_ops.cl"
+ATOMIC_OPS_SPIR = "numba_dppy/ocl/atomics/atomic_ops.spir"
+
+
+def ensure_spirv():
+    # Compiling atomic_ops.cl requires clang and llvm-spirv from oneAPI.
+    # Reuse a prebuilt atomic_ops.spir unless it is missing or older than
+    # atomic_ops.cl. Run "python setup.py build_spir" to force a rebuild.
+    if not os.path.isfile(ATOMIC_OPS_SPIR):
+        spirv_compile()
+    elif os.path.getmtime(ATOMIC_OPS_SPIR) < os.path.getmtime(ATOMIC_OPS_CL):
+        spirv_compile()
+
+
 def spirv_compile():
     if IS_LIN:
         compiler = "clang"
@@ -124,14 +157,14 @@ def spirv_compile():
         "-cl-std=CL2.0",
         "-Xclang",
         "-finclude-default-header",
-        "numba_dppy/ocl/atomics/atomic_ops.cl",
+        ATOMIC_OPS_CL,
         "-o",
         "numba_dppy/ocl/atomics/atomic_ops.bc",
     ]
     spirv_args = [
         "llvm-spirv",
         "-o",
-        "numba_dppy/ocl/atomics/atomic_ops.spir",
+        ATOMIC_OPS_SPIR,
         "numba_dppy/ocl/atomics/atomic_ops.bc",
     ]
     subprocess.check_call(clang_args, stderr=subprocess.STDOUT, shell=False)
@@ -156,6 +189,7 @@ metadata = dict(
     install_requires=install_requires,
     include_package_data=True,
     ext_modules=get_ext_modules(),
+    options={"build_ext": {"parallel": BUILD_JOBS}},
     author="Intel Corporation",
     classifiers=[
         "Development Status :: 4 - Beta",